@@ -6,21 +6,144 @@
 # outputs a direction when the object leaves the central "dead zone".
 # ------------------------------------------------------------
 
+import atexit
 import cv2
 import numpy as np
+import sys
+import threading
 import time
 
-# HSV color range for detecting green objects
+# Our frames are tiny, so OpenCV's worker threads cost more than they save;
+# run everything on the calling thread with the SIMD code paths enabled
+cv2.setNumThreads(1)
+cv2.setUseOptimized(True)
+
+# BGR thresholds for detecting green objects: a pixel is green when its
+# G channel is bright enough and clearly stronger than both R and B
 # These values can be adjusted depending on lighting conditions
-GREEN_LOWER = (29, 86, 6)
-GREEN_UPPER = (64, 255, 255)
+GREEN_MIN = 60        # Minimum value of the G channel
+GREEN_RATIO = 1.3     # G must be larger than R and B times this ratio
+
+# Capture resolution requested from the camera driver
+FRAME_WIDTH, FRAME_HEIGHT = 160, 120
+
+# Smallest blob area (pixels) treated as the object at the requested
+# resolution; scaled to the size the camera actually delivers
+MIN_AREA = 75
+
+# 3x3 kernel used to clean up noise in the mask
+KERNEL = cv2.getStructuringElement(cv2.MORPH_RECT, (3, 3))
+
+# Settings that depend on the real frame size, filled in by set_frame_size()
+frame_size = None     # (width, height) the settings below were computed for
+left_band = right_band = top_band = bottom_band = 0   # "Dead zone" edges
+min_area = MIN_AREA   # MIN_AREA scaled to the real frame size
+frame_buf = mask_buf = scaled_buf = cmp_buf = None    # Reused output buffers
+
+
+def set_frame_size(w, h):
+    """
+    Compute the "dead zone" in the center of the frame, the blob area
+    threshold and the reusable buffers for frames of w x h pixels.
+    The object only produces a direction once it leaves the dead zone.
+    """
+    global frame_size, left_band, right_band, top_band, bottom_band, min_area
+    global frame_buf, mask_buf, scaled_buf, cmp_buf
+
+    frame_size = (w, h)
+    left_band, right_band = w // 4, w - w // 4
+    top_band, bottom_band = h // 4, h - h // 4
+    min_area = MIN_AREA * (w * h) / (FRAME_WIDTH * FRAME_HEIGHT)
+
+    frame_buf = np.empty((h, w, 3), dtype=np.uint8)
+    mask_buf = np.empty((h, w), dtype=np.uint8)
+    scaled_buf = np.empty((h, w), dtype=np.uint8)
+    cmp_buf = np.empty((h, w), dtype=np.uint8)
+
+
+# Initialize webcam with the native back-end for this platform
+if sys.platform.startswith("win"):
+    cap = cv2.VideoCapture(0, cv2.CAP_DSHOW)
+elif sys.platform.startswith("linux"):
+    cap = cv2.VideoCapture(0, cv2.CAP_V4L2)
+else:
+    cap = cv2.VideoCapture(0)
+
+# Keep only one frame queued in the driver so we never read old gestures,
+# and ask for small frames directly instead of resizing them ourselves
+cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+cap.set(cv2.CAP_PROP_FRAME_WIDTH, FRAME_WIDTH)
+cap.set(cv2.CAP_PROP_FRAME_HEIGHT, FRAME_HEIGHT)
+
+# The driver may not honour the requested size, so start from the size
+# it reports; get_direction() still adapts if the frames differ from it
+set_frame_size(int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)) or FRAME_WIDTH,
+               int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)) or FRAME_HEIGHT)
+
+
+# ------------------------------------------------------------
+# Frame Grabber Thread
+# ------------------------------------------------------------
+class FrameGrabber(threading.Thread):
+    def __init__(self, cap):
+        """
+        Continuously read frames from the camera in the background
+        so the game loop always gets the newest frame without
+        waiting on the driver.
+        """
+        super().__init__(daemon=True)
+        self.cap = cap
+        self.frame = None           # Latest frame (shared with readers)
+        self.frame_id = 0           # Incremented for every new frame
+        self.lock = threading.Lock()
+        self.running = True
+        self._back = None           # Spare buffer the next frame is read into
+
+    def run(self):
+        """
+        Read into the spare buffer, then swap it with the shared
+        frame so the lock is only held for the swap itself.
+        """
+        while self.running:
+            ok, f = self.cap.read(self._back)
+            if not ok:
+                time.sleep(0.01)
+                continue
+            with self.lock:
+                self.frame, self._back = f, self.frame
+                self.frame_id += 1
 
-# Initialize webcam
-cap = cv2.VideoCapture(0)
+    def stop(self):
+        """
+        Stop the reading loop and wait for the thread to finish.
+        """
+        self.running = False
+        if self.is_alive():
+            self.join(timeout=1)
+
+
+# Start capturing in the background once, at import
+grabber = FrameGrabber(cap)
+grabber.start()
+
+
+def release_camera():
+    """
+    Stop the grabber thread and release the webcam.
+    """
+    grabber.stop()
+    cap.release()
+
+
+atexit.register(release_camera)
+
+# Show the annotated camera feed in an OpenCV window (slow; for tuning only)
+DEBUG = False
 
 # Variables for debouncing direction changes
 last_dir = None       # Last direction detected
 last_time = 0         # Timestamp of last update
+last_frame_id = 0     # Id of the last frame that was processed
 DEBOUNCE = 0.3        # Minimum time between direction updates (seconds)
 
 
@@ -31,66 +154,68 @@ def get_direction():
     a direction ("left", "right", "up", "down") if movement is detected.
 
     Returns:
-        str or None: The detected direction, or None if no update.
+        str or None: The detected direction, or None if no update
+        (including when no new frame has arrived since the last call).
     """
-    global last_dir, last_time
+    global last_dir, last_time, last_frame_id
 
-    # Read a frame from the camera
-    ok, frame = cap.read()
-    if not ok:
-        return None
+    # Take a mirrored copy of the newest frame from the grabber thread
+    # (flipped for natural movement), skipping all processing if it
+    # has not delivered a new one yet
+    with grabber.lock:
+        if grabber.frame is None or grabber.frame_id == last_frame_id:
+            return None
+        frame = cv2.flip(grabber.frame, 1, dst=frame_buf)
+        last_frame_id = grabber.frame_id
 
-    # Resize for faster processing and flip for natural movement
-    frame = cv2.resize(frame, (320, 240))
-    frame = cv2.flip(frame, 1)
-
-    # Convert frame to HSV color space
-    hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
+    # Recompute the size-dependent settings if the camera delivers
+    # frames of a different size than expected (happens at most once)
+    h, w = frame.shape[:2]
+    if (w, h) != frame_size:
+        set_frame_size(w, h)
 
-    # Create a mask that isolates green pixels
-    mask = cv2.inRange(hsv, np.array(GREEN_LOWER), np.array(GREEN_UPPER))
+    # Create a mask that isolates green pixels directly in BGR,
+    # without converting the whole frame to HSV
+    b, g, r = cv2.split(frame)
+    mask = cv2.inRange(g, GREEN_MIN, 255, dst=mask_buf)
+    for other in (r, b):
+        scaled = cv2.convertScaleAbs(other, dst=scaled_buf, alpha=GREEN_RATIO)
+        greener = cv2.compare(g, scaled, cv2.CMP_GT, dst=cmp_buf)
+        mask = cv2.bitwise_and(mask, greener, dst=mask)
 
-    # Reduce noise in the mask
-    mask = cv2.erode(mask, None, iterations=1)
-    mask = cv2.dilate(mask, None, iterations=1)
+    # Reduce noise in the mask (erode then dilate in a single call)
+    mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, KERNEL, dst=mask)
 
-    # Find contours (blobs) in the mask
-    contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    # Image moments of the mask: m00 is the number of green pixels and
+    # m10/m00, m01/m00 give their center
+    m = cv2.moments(mask, binaryImage=True)
 
-    h, w = frame.shape[:2]
     new_dir = None  # Direction detected this frame
 
-    if contours:
-        # Select the largest green contour
-        cnt = max(contours, key=cv2.contourArea)
+    # Ignore tiny noise blobs
+    if m["m00"] > min_area:
+        # Center point of the object
+        cx, cy = int(m["m10"] / m["m00"]), int(m["m01"] / m["m00"])
 
-        # Ignore tiny noise blobs
-        if cv2.contourArea(cnt) > 300:
-            # Bounding box around the detected object
-            x, y, cw, ch = cv2.boundingRect(cnt)
-            cx, cy = x + cw // 2, y + ch // 2  # Center point of the object
-
-            # Draw bounding box and center point for visual feedback
+        # Draw bounding box and center point for visual feedback
+        if DEBUG:
+            x, y, cw, ch = cv2.boundingRect(mask)
             cv2.rectangle(frame, (x, y), (x + cw, y + ch), (0, 255, 0), 2)
             cv2.circle(frame, (cx, cy), 5, (0, 0, 255), -1)
 
-            # Define the "dead zone" in the center of the screen
-            margin_x, margin_y = w // 4, h // 4
-            left_band, right_band = margin_x, w - margin_x
-            top_band, bottom_band = margin_y, h - margin_y
-
-            # Draw dead zone rectangle
+        # Draw dead zone rectangle
+        if DEBUG:
             cv2.rectangle(frame, (left_band, top_band), (right_band, bottom_band),(255, 200, 0), 1)
 
-            # Determine direction only if object is outside the dead zone
-            if cx < left_band:
-                new_dir = "left"
-            elif cx > right_band:
-                new_dir = "right"
-            elif cy < top_band:
-                new_dir = "up"
-            elif cy > bottom_band:
-                new_dir = "down"
+        # Determine direction only if object is outside the dead zone
+        if cx < left_band:
+            new_dir = "left"
+        elif cx > right_band:
+            new_dir = "right"
+        elif cy < top_band:
+            new_dir = "up"
+        elif cy > bottom_band:
+            new_dir = "down"
 
     # Debounce logic: update direction only if enough time has passed
     #this is were the import time is used
@@ -99,18 +224,19 @@ def get_direction():
         last_dir = new_dir
         last_time = now
 
-    # Display the detected direction on the frame
-    cv2.putText(frame, f"Direction: {last_dir}", (10, 25),
-                cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 255), 2)
+    if DEBUG:
+        # Display the detected direction on the frame
+        cv2.putText(frame, f"Direction: {last_dir}", (10, 25),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 255), 2)
 
-    # Show the camera feed
-    cv2.imshow("Gesture Control", frame)
+        # Show the camera feed
+        cv2.imshow("Gesture Control", frame)
 
-    # Quit if 'q' is pressed
-    if cv2.waitKey(1) & 0xFF == ord('q'):
-        cap.release()
-        cv2.destroyAllWindows()
-        return None
+        # Quit if 'q' is pressed
+        if cv2.waitKey(1) & 0xFF == ord('q'):
+            release_camera()
+            cv2.destroyAllWindows()
+            return None
 
     return last_dir
 
@@ -120,14 +246,35 @@ def get_direction():
 # gesture detection in action and print directions to console.
 # ------------------------------------------------------------
 if __name__ == "__main__":
+    # The camera window is the whole point of standalone mode
+    DEBUG = True
+
+    if not cap.isOpened():
+        raise SystemExit("Could not open the webcam")
+
+    # Wait for the first frame and create the window up front, so its
+    # visibility can be checked before get_direction() has shown anything
+    while grabber.frame is None:
+        time.sleep(0.01)
+    cv2.namedWindow("Gesture Control")
+
     while True:
-        direction = get_direction()
-        if direction:
-            print("Detected:", direction)
+        if grabber.frame_id == last_frame_id:
+            # No new frame yet: keep the window responsive without spinning
+            if cv2.waitKey(5) & 0xFF == ord('q'):
+                break
+        else:
+            direction = get_direction()
+            if direction:
+                print("Detected:", direction)
+
+            # 'q' inside get_direction() already released everything
+            if not grabber.running:
+                break
 
         # Stop if the window is closed manually
         if cv2.getWindowProperty("Gesture Control", cv2.WND_PROP_VISIBLE) < 1:
             break
 
-    cap.release()
+    release_camera()
     cv2.destroyAllWindows()
\ No newline at end of file
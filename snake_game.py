@@ -13,10 +13,13 @@
 
 import pygame
 import random
+from collections import deque
 
 # Game configuration
 GAME_WIDTH, GAME_HEIGHT = 600, 400
-SPEED = 2               # Game speed (frames per second)
+SPEED = 2               # Game speed (snake moves per second)
+FRAME_RATE = 15         # Input polling and redraw rate (frames per second)
+MOVE_INTERVAL = 1000 // SPEED   # Milliseconds between snake moves
 SPACE_SIZE = 20         # Size of each grid cell
 BODY_PARTS = 2          # Initial snake length
 
@@ -26,9 +29,28 @@ FOOD_COLOR = (255, 0, 150)  #pinkish red
 BG_COLOR = (10, 10, 10)     #dark background
 GRID_COLOR = (0, 255, 255)  #cyan grid lines
 
+# Movement vectors for each direction
+DIRS = {
+    "up": (0, -SPACE_SIZE),
+    "down": (0, SPACE_SIZE),
+    "left": (-SPACE_SIZE, 0),
+    "right": (SPACE_SIZE, 0)
+}
+
+# Every grid-aligned cell on the board, used for spawning food
+ALL_CELLS = [(x, y) for x in range(0, GAME_WIDTH, SPACE_SIZE)
+             for y in range(0, GAME_HEIGHT, SPACE_SIZE)]
+
+# Opposite of each direction (the snake cannot reverse into itself)
+OPPOSITES = {"up": "down", "down": "up", "left": "right", "right": "left"}
+
 # Initial movement direction
 direction = "right"
 
+# Direction of the last move actually made; several direction changes
+# can arrive between two moves, so reversals are checked against this
+moved_direction = "right"
+
 
 # ------------------------------------------------------------
 # Snake Class
@@ -36,29 +58,36 @@ direction = "right"
 class Snake:
     def __init__(self):
         """
-        Initialize the snake body as a list of grid-aligned coordinates.
+        Initialize the snake body as a deque of grid-aligned (x, y) tuples,
+        so adding a head and dropping the tail are both O(1).
         The snake starts with BODY_PARTS segments in a straight line.
+        body_set mirrors the occupied cells for O(1) self-collision checks.
         """
-        self.coordinates = [[100 - i * SPACE_SIZE, 100] for i in range(BODY_PARTS)]
+        self.coordinates = deque((100 - i * SPACE_SIZE, 100) for i in range(BODY_PARTS))
+        self.body_set = set(self.coordinates)
 
     def move(self):
         """
         Move the snake by inserting a new head based on the direction
         and removing the last segment (unless growing).
+        Returns the new head as an (x, y) tuple and whether it runs
+        into the snake's own body.
         """
         x, y = self.coordinates[0]
+        dx, dy = DIRS[direction]
+        new_head = (x + dx, y + dy)
 
-        # Movement vectors for each direction
-        dx, dy = {
-            "up": (0, -SPACE_SIZE),
-            "down": (0, SPACE_SIZE),
-            "left": (-SPACE_SIZE, 0),
-            "right": (SPACE_SIZE, 0)
-        }[direction]
+        # Remove tail; after growing the tail cell is still occupied
+        # by its duplicate, so only then does it stay in the set
+        tail = self.coordinates.pop()
+        if not self.coordinates or tail != self.coordinates[-1]:
+            self.body_set.discard(tail)
 
-        # Insert new head and remove tail
-        self.coordinates.insert(0, [x + dx, y + dy])
-        self.coordinates.pop()
+        # Insert new head
+        collided = new_head in self.body_set
+        self.coordinates.appendleft(new_head)
+        self.body_set.add(new_head)
+        return new_head, collided
 
     def grow(self):
         """
@@ -71,12 +100,17 @@ class Snake:
 # Food Class
 # ------------------------------------------------------------
 class Food:
-    def __init__(self):
+    def __init__(self, snake=None):
         """
         Spawn food at a random grid-aligned position.
+        If a snake is given, the food never spawns on its body;
+        pos is None when the snake fills the whole board.
         """
-        self.x = random.randrange(0, GAME_WIDTH, SPACE_SIZE)
-        self.y = random.randrange(0, GAME_HEIGHT, SPACE_SIZE)
+        if snake is not None:
+            free = [c for c in ALL_CELLS if c not in snake.body_set]
+            self.pos = random.choice(free) if free else None
+        else:
+            self.pos = random.choice(ALL_CELLS)
 
 
 # ------------------------------------------------------------
@@ -85,35 +119,44 @@ class Food:
 def change_direction(new_dir):
     """
     Change direction unless the new direction is the opposite
-    of the current one (prevents reversing into yourself).
+    of the last move (prevents reversing into yourself).
     """
     global direction
-    opposites = {"up": "down", "down": "up", "left": "right", "right": "left"}
 
-    if new_dir and opposites[direction] != new_dir:
+    if new_dir and OPPOSITES[moved_direction] != new_dir:
         direction = new_dir
 
 
 # ------------------------------------------------------------
 # Collision Detection
 # ------------------------------------------------------------
-def check_collision(snake):
+def check_collision(head):
     """
-    Returns True if the snake hits the wall or its own body.
+    Returns True if the snake's head hits the wall.
+    Self collision is reported by Snake.move().
     """
-    head = snake.coordinates[0]
-
     # Wall collision
     if head[0] < 0 or head[0] >= GAME_WIDTH or head[1] < 0 or head[1] >= GAME_HEIGHT:
         return True
 
-    # Self collision
-    if head in snake.coordinates[1:]:
-        return True
-
     return False
 
 
+# ------------------------------------------------------------
+# Fonts
+# ------------------------------------------------------------
+fonts = {}  # Loaded fonts by size, reused across screens and restarts
+
+
+def get_font(size):
+    """
+    Return the Arial font of the given size, loading it only once.
+    """
+    if size not in fonts:
+        fonts[size] = pygame.font.SysFont("Arial", size)
+    return fonts[size]
+
+
 # ------------------------------------------------------------
 # Start Screen
 # ------------------------------------------------------------
@@ -122,15 +165,13 @@ def start_screen(screen):
     Display a simple start screen that waits for the player
     to press SPACE before beginning the game.
     """
-    title_font = pygame.font.SysFont("Arial", 40)
-    small_font = pygame.font.SysFont("Arial", 25)
+    # The text never changes, so render it once
+    title = get_font(40).render("SNAKE GAME", True, (0, 255, 0))
+    prompt = get_font(25).render("Press SPACE to Start", True, (0, 255, 255))
 
     while True:
         screen.fill((10, 10, 10))
 
-        title = title_font.render("SNAKE GAME", True, (0, 255, 0))
-        prompt = small_font.render("Press SPACE to Start", True, (0, 255, 255))
-
         screen.blit(title, (GAME_WIDTH // 2 - title.get_width() // 2, 120))
         screen.blit(prompt, (GAME_WIDTH // 2 - prompt.get_width() // 2, 200))
 
@@ -151,15 +192,13 @@ def game_over_screen(screen):
     Display a game over screen with options to restart (R)
     or quit (Q).
     """
-    title_font = pygame.font.SysFont("Arial", 40)
-    small_font = pygame.font.SysFont("Arial", 25)
+    # The text never changes, so render it once
+    over = get_font(40).render("GAME OVER", True, (255, 0 , 150))
+    prompt = get_font(25).render("Press R to Restart or Q to Quit", True, (0, 255, 0))
 
     while True:
         screen.fill((10, 10, 10))
 
-        over = title_font.render("GAME OVER", True, (255, 0 , 150))
-        prompt = small_font.render("Press R to Restart or Q to Quit", True, (0, 255, 0))
-
         screen.blit(over, (GAME_WIDTH // 2 - over.get_width() // 2, 120))
         screen.blit(prompt, (GAME_WIDTH // 2 - prompt.get_width() // 2, 200))
 
@@ -183,23 +222,42 @@ def run_game(direction_callback=None):
     Runs the Snake game. If a direction_callback is provided,
     it overrides keyboard input (e.g., camera gesture control).
     """
-    global direction
+    global direction, moved_direction
 
     pygame.init()
     screen = pygame.display.set_mode((GAME_WIDTH, GAME_HEIGHT))
     clock = pygame.time.Clock()
 
+    # Pre-render the background and grid once; each frame just blits it
+    grid_surf = pygame.Surface((GAME_WIDTH, GAME_HEIGHT))
+    grid_surf.fill(BG_COLOR)
+    for x in range(0, GAME_WIDTH, SPACE_SIZE):
+        pygame.draw.line(grid_surf, GRID_COLOR, (x, 0), (x, GAME_HEIGHT))
+    for y in range(0, GAME_HEIGHT, SPACE_SIZE):
+        pygame.draw.line(grid_surf, GRID_COLOR, (0, y), (GAME_WIDTH, y))
+    grid_surf = grid_surf.convert()
+
+    # Pre-render one snake segment and one food cell for blitting
+    seg_surf = pygame.Surface((SPACE_SIZE, SPACE_SIZE))
+    seg_surf.fill(SNAKE_COLOR)
+    seg_surf = seg_surf.convert()
+    food_surf = pygame.Surface((SPACE_SIZE, SPACE_SIZE))
+    food_surf.fill(FOOD_COLOR)
+    food_surf = food_surf.convert()
+
     # Show start screen
     if not start_screen(screen):
+        fonts.clear()
         pygame.quit()
         return
 
     # Game restart loop
     while True:
-        direction = "right"
+        direction = moved_direction = "right"
         snake = Snake()
-        food = Food()
+        food = Food(snake)
         running = True
+        last_move_ms = pygame.time.get_ticks()
 
         # Main gameplay loop
         while running:
@@ -208,6 +266,9 @@ def run_game(direction_callback=None):
                 if e.type == pygame.QUIT:
                     running = False
                 elif e.type == pygame.KEYDOWN:
+                    # Quit the round with Q (the camera window is hidden)
+                    if e.key == pygame.K_q:
+                        running = False
                     keys = {
                         pygame.K_UP: "up",
                         pygame.K_DOWN: "down",
@@ -217,45 +278,53 @@ def run_game(direction_callback=None):
                     change_direction(keys.get(e.key))
 
             # Optional camera-based direction override
-            if direction_callback:
-                change_direction(direction_callback() or direction)
-
-            # Move snake
-            snake.move()
-
-            # Check for collisions
-            if check_collision(snake):
-                break
-
-            # Check if food is eaten
-            if snake.coordinates[0] == [food.x, food.y]:
-                snake.grow()
-                food = Food()
-
-            # Draw background
-            screen.fill(BG_COLOR)
-
-            # Draw grid
-            for x in range(0, GAME_WIDTH, SPACE_SIZE):
-                pygame.draw.line(screen, GRID_COLOR, (x, 0), (x, GAME_HEIGHT))
-            for y in range(0, GAME_HEIGHT, SPACE_SIZE):
-                pygame.draw.line(screen, GRID_COLOR, (0, y), (GAME_WIDTH, y))
-
-            # Draw snake
-            for x, y in snake.coordinates:
-                pygame.draw.rect(screen, SNAKE_COLOR, (x, y, SPACE_SIZE, SPACE_SIZE))
+            new_dir = direction_callback() if direction_callback else None
+            if new_dir:
+                change_direction(new_dir)
+
+            # Input is polled every frame, but the snake only moves
+            # once every MOVE_INTERVAL milliseconds
+            now = pygame.time.get_ticks()
+            if now - last_move_ms >= MOVE_INTERVAL:
+                # Stay on a fixed schedule so frame boundaries don't add up,
+                # but don't try to catch up after falling a full move behind
+                last_move_ms += MOVE_INTERVAL
+                if now - last_move_ms >= MOVE_INTERVAL:
+                    last_move_ms = now
+
+                # Move snake and check for collisions
+                head, hit_self = snake.move()
+                moved_direction = direction
+                if hit_self or check_collision(head):
+                    break
+
+                # Check if food is eaten
+                if head == food.pos:
+                    snake.grow()
+                    food = Food(snake)
+
+                    # No free cell left: the board is full, end the round
+                    if food.pos is None:
+                        break
+
+            # Draw background and grid
+            screen.blit(grid_surf, (0, 0))
+
+            # Draw snake (all segments in one batched call)
+            screen.blits([(seg_surf, pos) for pos in snake.coordinates], False)
 
             # Draw food
-            pygame.draw.rect(screen, FOOD_COLOR, (food.x, food.y, SPACE_SIZE, SPACE_SIZE))
+            screen.blit(food_surf, food.pos)
 
             pygame.display.flip()
-            clock.tick(SPEED)
+            clock.tick(FRAME_RATE)
 
         # Show game over screen
         action = game_over_screen(screen)
         if action == "quit":
             break
 
+    fonts.clear()
     pygame.quit()
 
 